@@ -7,6 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
 
 from .const import CONF_HOUSE_ID, DEFAULT_HOUSE_ID, DOMAIN, PLATFORMS
 from .coordinator import ContromeDataUpdateCoordinator
@@ -51,24 +52,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_migrate_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Migrate old room-based entities to new thermostat-based entities."""
-    from homeassistant.helpers import entity_registry as er
-    
     entity_reg = er.async_get(hass)
     
-    # Remove old room-based climate entities (Room Climate Control)
-    entities_to_remove = []
-    for entity in er.async_entries_for_config_entry(entity_reg, entry.entry_id):
-        # Identify old room entities by their unique_id pattern
-        if entity.unique_id.startswith("controme_room_"):
-            _LOGGER.info("Removing old room-based entity: %s", entity.entity_id)
-            entities_to_remove.append(entity.entity_id)
+    # Identify old room-based climate entities (Room Climate Control) by their unique_id pattern
+    entities_to_remove = [
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(entity_reg, entry.entry_id)
+        if entity.unique_id.startswith("controme_room_")
+    ]
+    if not entities_to_remove:
+        return
     
     # Remove the old entities
     for entity_id in entities_to_remove:
+        _LOGGER.info("Removing old room-based entity: %s", entity_id)
         entity_reg.async_remove(entity_id)
     
-    if entities_to_remove:
-        _LOGGER.info("Migrated %d old room-based entities to thermostat-based entities", len(entities_to_remove))
+    _LOGGER.info("Migrated %d old room-based entities to thermostat-based entities", len(entities_to_remove))
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -12,7 +12,7 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -23,10 +23,9 @@ from .const import (
     ATTR_ROOM_ID,
     ATTR_VALVE_POSITIONS,
     DOMAIN,
-    MANUFACTURER,
-    MODEL_THERMOSTAT,
 )
 from .coordinator import ContromeDataUpdateCoordinator
+from .entity import thermostat_device_info
 from controme_scraper.models import Thermostat
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,11 +40,10 @@ async def async_setup_entry(
     coordinator: ContromeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Create climate entities for each thermostat
-    entities = []
-    thermostats: list[Thermostat] = coordinator.data.get("thermostats", [])
-    
-    for thermostat in thermostats:
-        entities.append(ContromeClimate(coordinator, thermostat.device_id))
+    thermostats = coordinator.thermostats
+    entities = [
+        ContromeClimate(coordinator, thermostat.device_id) for thermostat in thermostats
+    ]
     
     _LOGGER.info("Setting up %d Controme climate entities (thermostats)", len(entities))
     async_add_entities(entities)
@@ -55,6 +53,7 @@ class ContromeClimate(CoordinatorEntity, ClimateEntity):
     """Representation of a Controme Thermostat as a Climate entity."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_hvac_modes = [HVACMode.HEAT, HVACMode.AUTO]
     _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
@@ -68,83 +67,77 @@ class ContromeClimate(CoordinatorEntity, ClimateEntity):
         device_id: str,
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=device_id)
         self._device_id = device_id
         self._attr_unique_id = f"controme_thermostat_{device_id.replace('*', '_')}"
+        self._attr_device_info = thermostat_device_info(coordinator, device_id)
+        self._attr_name = f"Thermostat {device_id}"
+        # Identity attributes never change for a device, so they are built once
+        thermostat = self.thermostat
+        self._static_attrs: dict[str, Any] = {
+            "device_id": device_id,
+            "mac_address": thermostat.mac_address if thermostat else None,
+        }
+        self._update_from_coordinator()
 
     @property
     def thermostat(self) -> Thermostat | None:
         """Get the current thermostat data from coordinator."""
-        thermostats: list[Thermostat] = self.coordinator.data.get("thermostats", [])
-        return next((t for t in thermostats if t.device_id == self._device_id), None)
+        return self.coordinator.get_thermostat(self._device_id)
 
-    @property
-    def name(self) -> str:
-        """Return the name of the climate entity."""
-        thermostat = self.thermostat
-        return thermostat.name if thermostat else f"Thermostat {self._device_id}"
+    async def async_added_to_hass(self) -> None:
+        """Register as a consumer of thermostat configuration values."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_config_consumer())
 
     @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        thermostat = self.thermostat
-        return thermostat.current_temperature if thermostat else None
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        thermostat = self.thermostat
-        return thermostat.target_temperature if thermostat else None
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self._attr_available
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
         # Always return HEAT for floor heating (no cooling)
         return HVACMode.HEAT
-    
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return current HVAC action (heating/idle)."""
-        thermostat = self.thermostat
-        if thermostat and thermostat.is_heating:
-            return HVACAction.HEATING
-        return HVACAction.IDLE
 
-    @property
-    def icon(self) -> str:
-        """Return the icon for the entity."""
-        # Icon now reflects hvac_action
-        if self.hvac_action == HVACAction.HEATING:
-            return "mdi:fire"
-        return "mdi:home-thermometer"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Nothing to do if this device did not change in the last update
+        changed = self.coordinator.changed_device_ids
+        if changed is not None and self._device_id not in changed:
+            return
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this entity."""
+    def _update_from_coordinator(self) -> None:
+        """Snapshot the current thermostat data into entity attributes."""
         thermostat = self.thermostat
-        if not thermostat:
-            return {}
-        
-        return {
-            "identifiers": {(DOMAIN, thermostat.device_id)},
-            "name": thermostat.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_THERMOSTAT,
-            "sw_version": thermostat.firmware_version,
-            "suggested_area": thermostat.room_name or thermostat.floor_name,
-        }
+        if thermostat is None:
+            # Thermostat vanished from the latest data, like the thermostat sensors
+            self._attr_available = False
+            return
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes with all 12 configuration options."""
-        thermostat = self.thermostat
-        if not thermostat:
-            return {}
+        self._attr_available = True
+        self._attr_name = thermostat.name
+        self._attr_current_temperature = thermostat.current_temperature
+        self._attr_target_temperature = thermostat.target_temperature
+
+        # Icon reflects hvac_action
+        if thermostat.is_heating:
+            self._attr_hvac_action = HVACAction.HEATING
+            self._attr_icon = "mdi:fire"
+        else:
+            self._attr_hvac_action = HVACAction.IDLE
+            self._attr_icon = "mdi:home-thermometer"
 
+        self._attr_extra_state_attributes = self._build_attrs(thermostat)
+
+    def _build_attrs(self, thermostat: Thermostat) -> dict[str, Any]:
+        """Build additional state attributes with all 12 configuration options."""
         attrs = {
-            # Device identity
-            "device_id": thermostat.device_id,
-            "mac_address": thermostat.mac_address,
+            **self._static_attrs,
             
             # Room assignment
             ATTR_ROOM_ID: thermostat.assigned_room_id,
@@ -172,13 +165,15 @@ class ContromeClimate(CoordinatorEntity, ClimateEntity):
         
         # Add relative valve positions if available
         if thermostat.max_valve_positions:
-            attrs["max_valve_positions"] = thermostat.max_valve_positions
-            attrs["relative_valve_positions"] = [
-                round(p, 1) for p in thermostat.relative_valve_positions
-            ]
-            if thermostat.average_relative_valve_position is not None:
+            # Compute relative positions once; the average derives from the same list
+            relative_positions = thermostat.relative_valve_positions
+            attrs.update(
+                max_valve_positions=thermostat.max_valve_positions,
+                relative_valve_positions=[round(p, 1) for p in relative_positions],
+            )
+            if relative_positions:
                 attrs["average_relative_valve_position"] = round(
-                    thermostat.average_relative_valve_position, 1
+                    sum(relative_positions) / len(relative_positions), 1
                 )
         
         # Add return flow temperatures if available
@@ -206,20 +201,16 @@ class ContromeClimate(CoordinatorEntity, ClimateEntity):
         )
 
         # Get room_id from thermostat's assigned room
-        thermostat = self.coordinator.data.get("thermostats", [])
-        thermostat_data = next(
-            (t for t in thermostat if t.device_id == self._device_id),
-            None
-        )
+        thermostat_data = self.coordinator.get_thermostat(self._device_id)
         
-        if not thermostat_data or not thermostat_data.assigned_room:
+        if not thermostat_data or not thermostat_data.assigned_room_id:
             _LOGGER.error(
                 "Cannot set temperature: thermostat %s not assigned to a room",
                 self._device_id
             )
             return
         
-        room_id = thermostat_data.assigned_room
+        room_id = thermostat_data.assigned_room_id
         
         # Set room temperature via API
         success = await self.hass.async_add_executor_job(
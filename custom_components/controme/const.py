@@ -16,6 +16,9 @@ CONF_HOUSE_ID = "house_id"
 # Default values
 DEFAULT_NAME = "Controme"
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=60)
+REQUEST_REFRESH_COOLDOWN = 2.0  # seconds
+PARAMETER_WRITE_COOLDOWN = 0.5  # seconds
+ROOMS_REFRESH_INTERVAL = 1800.0  # seconds
 DEFAULT_TIMEOUT = 30
 DEFAULT_HOUSE_ID = 1
 
@@ -1,19 +1,66 @@
 """DataUpdateCoordinator for Controme Smart-Heat-OS integration."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import fields
 from datetime import timedelta
+from functools import partial
 import logging
-from typing import Any
+import time
+from types import MappingProxyType
+from typing import Any, Mapping
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    PARAMETER_WRITE_COOLDOWN,
+    REQUEST_REFRESH_COOLDOWN,
+    ROOMS_REFRESH_INTERVAL,
+)
 from controme_scraper.controller import ContromeController
-from controme_scraper.models import Gateway
+from controme_scraper.models import Gateway, Room, Thermostat
 
 _LOGGER = logging.getLogger(__name__)
 
+# Thermostat fields that change on every poll but are not shown by any entity
+_VOLATILE_FIELDS = frozenset(("last_update",))
+
+# Thermostat index used until the first successful update
+_NO_THERMOSTATS: Mapping[str, Thermostat] = MappingProxyType({})
+
+# Thermostat fields only filled when the configuration page is fetched
+_CONFIG_FIELDS = (
+    "description",
+    "sensor_offset",
+    "display_brightness",
+    "send_interval",
+    "deviation",
+    "force_send_count",
+    "device_type",
+    "locked",
+    "is_main_sensor",
+    "temp_mode_temporary",
+    "battery_saving_mode",
+)
+
+# Values a thermostat holds for the configuration fields when they were not scraped
+_CONFIG_DEFAULTS = {
+    field.name: field.default for field in fields(Thermostat) if field.name in _CONFIG_FIELDS
+}
+
+
+def _thermostat_state(thermostat: Thermostat) -> tuple[Any, ...]:
+    """Return the thermostat field values that entities show."""
+    return tuple(
+        getattr(thermostat, field.name)
+        for field in fields(thermostat)
+        if field.name not in _VOLATILE_FIELDS
+    )
+
 
 class ContromeDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Controme data from the API."""
@@ -29,38 +76,187 @@ class ContromeDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=DEFAULT_SCAN_INTERVAL,
+            # Only notify entities when the fetched data actually changed
+            always_update=False,
+            # Coalesce refresh requests from rapid consecutive entity writes
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.controller = controller
         self.gateway_id = "main"
         self.gateway_name = "Controme Gateway"
 
+        # Number of added entities that read thermostat configuration values
+        self._config_consumers = 0
+
+        # Thermostats from the last successful update, for direct access by entities
+        self.thermostats: list[Thermostat] = []
+        self.thermostats_by_id: Mapping[str, Thermostat] = _NO_THERMOSTATS
+
+        # Configuration values from the last update that scraped them, by device id.
+        # Kept apart from the data so optimistically written values are never carried
+        # forward.
+        self._scraped_config: dict[str, dict[str, Any]] = {}
+
+        # Monotonic time of the last successful room list fetch
+        self._rooms_fetched_at: float | None = None
+
+        # Device ids whose thermostat data changed in the last update (None means all)
+        self.changed_device_ids: frozenset[str] | None = None
+
+        # Thermostat parameter writes waiting to be sent, keyed by (device_num, param_name)
+        # so a later write to the same parameter supersedes an earlier one
+        self._pending_writes: dict[tuple[int, str], Any] = {}
+        self._write_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PARAMETER_WRITE_COOLDOWN,
+            immediate=False,
+            function=self._async_flush_parameter_writes,
+        )
+
+    def get_thermostat(self, device_id: str) -> Thermostat | None:
+        """Return the thermostat with the given device id from the last update."""
+        return self.thermostats_by_id.get(device_id)
+
+    @callback
+    def async_add_config_consumer(self) -> CALLBACK_TYPE:
+        """Register an entity that needs thermostat configuration values."""
+        self._config_consumers += 1
+
+        @callback
+        def _remove_config_consumer() -> None:
+            self._config_consumers -= 1
+
+        return _remove_config_consumer
+
+    def queue_parameter_write(self, device_num: int, param_name: str, param_value: Any) -> None:
+        """Queue a thermostat parameter write to be sent with the next batch.
+
+        All writing platforms (number, select, switch) go through this queue and
+        show the written value optimistically via async_notify_thermostat_changed,
+        instead of waiting for the write or blocking the entity with a cooldown.
+        """
+        self._pending_writes[(device_num, param_name)] = param_value
+        self.hass.async_create_task(self._write_debouncer.async_call())
+
+    @callback
+    def async_notify_thermostat_changed(self, device_id: str) -> None:
+        """Notify the entities of a thermostat after it was updated in place with a written value."""
+        # Unlike async_set_updated_data, this leaves the refresh schedule and the
+        # status of the last update alone. Thermostat entities listen with their
+        # device id as context, so only that device's entities are woken up.
+        self.changed_device_ids = frozenset((device_id,))
+        for update_callback, context in list(self._listeners.values()):
+            if context == device_id:
+                update_callback()
+
+    async def _async_flush_parameter_writes(self, refresh: bool = True) -> None:
+        """Send all queued parameter writes in a single executor job."""
+        if not self._pending_writes:
+            return
+        writes, self._pending_writes = self._pending_writes, {}
+
+        failed = await self.hass.async_add_executor_job(self._write_parameters, writes)
+        for device_num, param_name in failed:
+            _LOGGER.error(
+                "Failed to update %s for thermostat %s",
+                param_name,
+                device_num,
+            )
+
+        if not refresh:
+            return
+
+        # Don't hold up the flush while the debounced refresh waits to run
+        self.hass.async_create_background_task(
+            self.async_request_refresh(), name="controme_refresh_after_write"
+        )
+
+    def _write_parameters(self, writes: dict[tuple[int, str], Any]) -> list[tuple[int, str]]:
+        """Write parameters one by one and return the ones that failed."""
+        # The web client has no bulk endpoint, so writes are sent sequentially
+        set_parameter = self.controller.web_client.set_thermostat_parameter
+        failed = []
+        for (device_num, param_name), param_value in writes.items():
+            try:
+                success = set_parameter(device_num, param_name, param_value)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Error writing %s for thermostat %s: %s", param_name, device_num, err)
+                success = False
+            if not success:
+                failed.append((device_num, param_name))
+        return failed
+
+    async def async_shutdown(self) -> None:
+        """Send any queued parameter writes before shutting down."""
+        self._write_debouncer.async_cancel()
+        # No follow-up refresh, the coordinator is about to stop
+        await self._async_flush_parameter_writes(refresh=False)
+        await super().async_shutdown()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Controme."""
+        # The configuration pages are only scraped while an entity uses them,
+        # and always on the first refresh
+        include_config = self._config_consumers > 0 or self.data is None
         try:
-            # Fetch all thermostats (includes config, valve data, and return flow temps)
-            from functools import partial
-            thermostats = await self.hass.async_add_executor_job(
-                partial(self.controller.get_thermostats, include_config=True, include_valve_data=True)
+            # Fetch all thermostats (includes config, valve data, and return flow temps),
+            # sensors (for standalone return flow sensors) and, when due, rooms (for room
+            # assignment) concurrently
+            thermostats, sensors, rooms = await asyncio.gather(
+                self.hass.async_add_executor_job(
+                    partial(
+                        self.controller.get_thermostats,
+                        include_config=include_config,
+                        include_valve_data=True,
+                    )
+                ),
+                self.hass.async_add_executor_job(self.controller.get_sensors),
+                self._async_fetch_rooms(),
             )
             
             if thermostats is None:
                 raise UpdateFailed("Failed to fetch thermostats from Controme")
             
-            # Fetch sensors (for standalone return flow sensors)
-            sensors = await self.hass.async_add_executor_job(
-                self.controller.get_sensors
-            )
+            if include_config:
+                self._scraped_config = {
+                    t.device_id: {field: getattr(t, field) for field in _CONFIG_FIELDS}
+                    for t in thermostats
+                }
+            else:
+                self._carry_forward_config(thermostats)
             
-            # Create Gateway object with system-wide metrics
-            # Calculate from thermostats instead of rooms
-            all_valve_positions = []
-            for t in thermostats:
-                all_valve_positions.extend(t.valve_positions)
+            # Index thermostats by device_id for O(1) lookups from entities
+            thermostats_by_id = {t.device_id: t for t in thermostats}
             
-            avg_valve_position = None
-            if all_valve_positions:
-                avg_valve_position = int(sum(all_valve_positions) / len(all_valve_positions))
+            # Diff against the previous data once so entities of unchanged devices can skip work
+            self.changed_device_ids = self._changed_device_ids(thermostats_by_id)
             
+            previous = self.data
+            if rooms is None and previous is None:
+                # The first room scan failed; start without rooms
+                rooms = []
+            if rooms is not None:
+                # Map room names to ids and back for room assignment selects
+                room_ids_by_name = {room.name: room.room_id for room in rooms}
+                room_id_to_name = {room.room_id: room.name for room in rooms}
+            
+            if previous is not None and (
+                rooms is None or room_ids_by_name == previous["room_ids_by_name"]
+            ):
+                if self.changed_device_ids == frozenset():
+                    # Nothing shown by an entity changed. Thermostats and sensors carry
+                    # per-poll timestamps, so the previous data is returned as is to let
+                    # the coordinator skip notifying listeners (always_update=False).
+                    return previous
+                # Keep the previous room list and maps, so selects see no change
+                rooms = previous["rooms"]
+                room_ids_by_name = previous["room_ids_by_name"]
+                room_id_to_name = previous["room_id_to_name"]
+            
+            # Create Gateway object with system-wide metrics
             gateway = Gateway(
                 gateway_id=self.gateway_id,
                 name=self.gateway_name,
@@ -69,19 +265,144 @@ class ContromeDataUpdateCoordinator(DataUpdateCoordinator):
                 rooms=[],  # No longer used, thermostats are primary
             )
             
+            self.thermostats = thermostats
+            self.thermostats_by_id = thermostats_by_id
+            
+            # System-wide valve statistics shared by the gateway sensors
+            aggregates = self._compute_aggregates(thermostats)
+            
             _LOGGER.debug(
                 "Successfully updated Controme data: %d thermostats, %d sensors, system demand: %s%%",
                 len(thermostats),
                 len(sensors) if sensors else 0,
-                avg_valve_position,
+                aggregates["sys_avg"],
             )
             
             return {
                 "thermostats": thermostats,
                 "gateway": gateway,
                 "sensors": sensors or [],
+                "rooms": rooms,
+                "room_ids_by_name": room_ids_by_name,
+                "room_id_to_name": room_id_to_name,
+                "_agg": aggregates,
             }
             
         except Exception as err:
+            self.changed_device_ids = None
             _LOGGER.error("Error updating Controme data: %s", err)
             raise UpdateFailed(f"Error communicating with Controme: {err}") from err
+
+    async def _async_fetch_rooms(self) -> list[Room] | None:
+        """Fetch the room list when it is due, or return None to keep the previous one."""
+        # The room scan costs one request per room and rooms rarely change,
+        # so it only runs on the first refresh and then on a slow interval
+        now = time.monotonic()
+        if (
+            self._rooms_fetched_at is not None
+            and now - self._rooms_fetched_at < ROOMS_REFRESH_INTERVAL
+        ):
+            return None
+
+        try:
+            rooms = await self.hass.async_add_executor_job(
+                partial(
+                    self.controller.get_rooms,
+                    include_max_positions=False,
+                    include_return_flow=False,
+                )
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # A failed room scan must not fail the thermostat update
+            _LOGGER.warning("Error fetching Controme rooms: %s", err)
+            return None
+
+        self._rooms_fetched_at = now
+        return rooms
+
+    @staticmethod
+    def _compute_aggregates(thermostats: list[Thermostat]) -> dict[str, Any]:
+        """Compute valve statistics for all thermostats in a single pass."""
+        total_positions_sum = 0
+        total_positions_count = 0
+        active_heating = 0
+        high_count = 0
+        low_count = 0
+        room_avgs: dict[str, float] = {}
+        room_avg_attrs: dict[str, float] = {}
+        high_rooms: list[dict[str, Any]] = []
+        low_rooms: list[dict[str, Any]] = []
+        valve_attrs: dict[str, dict[str, int | None]] = {}
+        for t in thermostats:
+            if t.is_heating:
+                active_heating += 1
+            valve_positions = t.valve_positions
+            if valve_positions:
+                valve_attrs[t.device_id] = {
+                    f"valve_{idx + 1}_position": pos for idx, pos in enumerate(valve_positions)
+                }
+            valid_positions = [p for p in valve_positions if p is not None]
+            if not valid_positions:
+                continue
+            positions_sum = sum(valid_positions)
+            positions_count = len(valid_positions)
+            total_positions_sum += positions_sum
+            total_positions_count += positions_count
+            room_avg = positions_sum / positions_count
+            rounded_avg = round(room_avg, 1)
+            room_avgs[t.device_id] = room_avg
+            name = t.name
+            room_avg_attrs[f"room_{name.replace(' ', '_').lower()}"] = rounded_avg
+            # Classify on the integer sums so the thresholds are exact
+            if positions_sum > 80 * positions_count:
+                high_count += 1
+                high_rooms.append({"name": name, "average_position": rounded_avg})
+            elif positions_sum < 20 * positions_count:
+                low_count += 1
+                low_rooms.append({"name": name, "average_position": rounded_avg})
+
+        return {
+            "sys_avg": (
+                int(total_positions_sum / total_positions_count)
+                if total_positions_count
+                else None
+            ),
+            "total_positions_sum": total_positions_sum,
+            "total_positions_count": total_positions_count,
+            "room_avgs": room_avgs,
+            "room_avg_attrs": room_avg_attrs,
+            "room_based_avg": (
+                round(sum(room_avgs.values()) / len(room_avgs), 1) if room_avgs else None
+            ),
+            "high_count": high_count,
+            "low_count": low_count,
+            "high_rooms": high_rooms,
+            "low_rooms": low_rooms,
+            "active_heating": active_heating,
+            "valve_attrs": valve_attrs,
+        }
+
+    def _carry_forward_config(self, thermostats: list[Thermostat]) -> None:
+        """Fill configuration values the basic scrape left unset from the last full scrape."""
+        for thermostat in thermostats:
+            scraped = self._scraped_config.get(thermostat.device_id)
+            if scraped is None:
+                continue
+            for field, value in scraped.items():
+                if getattr(thermostat, field) == _CONFIG_DEFAULTS[field]:
+                    setattr(thermostat, field, value)
+
+    def _changed_device_ids(self, thermostats_by_id: dict[str, Thermostat]) -> frozenset[str] | None:
+        """Return the ids of thermostats that were added, changed or removed."""
+        # Without successful previous data every device has to be treated as changed
+        if self.data is None or not self.last_update_success:
+            return None
+        previous = self.thermostats_by_id
+        changed = {
+            device_id
+            for device_id, thermostat in thermostats_by_id.items()
+            if device_id not in previous
+            or _thermostat_state(previous[device_id]) != _thermostat_state(thermostat)
+        }
+        changed.update(previous.keys() - thermostats_by_id.keys())
+        return frozenset(changed)
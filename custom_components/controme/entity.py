@@ -0,0 +1,30 @@
+"""Shared entity helpers for Controme Smart-Heat-OS integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import DOMAIN, MANUFACTURER, MODEL_THERMOSTAT
+from .coordinator import ContromeDataUpdateCoordinator
+
+
+def thermostat_device_info(
+    coordinator: ContromeDataUpdateCoordinator,
+    device_id: str,
+) -> dict[str, Any] | None:
+    """Return device information for a thermostat.
+
+    Home Assistant only reads device info when an entity is added, so entities
+    set it once at construction.
+    """
+    thermostat = coordinator.get_thermostat(device_id)
+    if thermostat is None:
+        return None
+
+    return {
+        "identifiers": {(DOMAIN, thermostat.device_id)},
+        "name": thermostat.name,
+        "manufacturer": MANUFACTURER,
+        "model": MODEL_THERMOSTAT,
+        "sw_version": thermostat.firmware_version,
+        "suggested_area": thermostat.room_name or thermostat.floor_name,
+    }
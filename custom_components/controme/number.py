@@ -2,17 +2,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL_THERMOSTAT
+from .const import DOMAIN
 from .coordinator import ContromeDataUpdateCoordinator
+from .entity import thermostat_device_info
 from controme_scraper.models import Thermostat
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,16 +27,12 @@ async def async_setup_entry(
     coordinator: ContromeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Create number entities for each thermostat
-    entities = []
-    thermostats: list[Thermostat] = coordinator.data.get("thermostats", [])
-    
-    for thermostat in thermostats:
-        # 6 number entities per thermostat
-        entities.append(ContromeSensorOffset(coordinator, thermostat.device_id))
-        entities.append(ContromeDisplayBrightness(coordinator, thermostat.device_id))
-        entities.append(ContromeSendInterval(coordinator, thermostat.device_id))
-        entities.append(ContromeDeviation(coordinator, thermostat.device_id))
-        entities.append(ContromeForceSendCount(coordinator, thermostat.device_id))
+    thermostats = coordinator.thermostats
+    entities = [
+        number_class(coordinator, thermostat.device_id)
+        for thermostat in thermostats
+        for number_class in _NUMBER_CLASSES
+    ]
     
     _LOGGER.info("Setting up %d Controme number entities", len(entities))
     async_add_entities(entities)
@@ -46,6 +42,14 @@ class ContromeNumberBase(CoordinatorEntity, NumberEntity):
     """Base class for Controme number entities."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    # Controme API parameter name, set by each subclass
+    _param_name: str
+    # Formatting of values sent to the API, matching the entity step; integer
+    # fields are read from the thermostat as float and written as int
+    _value_fmt = "{:d}"
+    _integer_value = True
 
     def __init__(
         self,
@@ -55,36 +59,68 @@ class ContromeNumberBase(CoordinatorEntity, NumberEntity):
         name: str,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=device_id)
         self._device_id = device_id
         self._key = key
-        self._attr_unique_id = f"controme_{device_id.replace('*', '_')}_{key}"
+        self._safe_device_id = device_id.replace('*', '_')
+        self._attr_unique_id = f"controme_{self._safe_device_id}_{key}"
         self._attr_name = name
-        self._last_change_time = None
+        self._attr_device_info = thermostat_device_info(coordinator, device_id)
+
+        # Extract device number from device_id (RFAktor*1 -> 1)
+        try:
+            self._device_num: int | None = int(device_id.split('*', 1)[1])
+        except (IndexError, ValueError):
+            self._device_num = None
+
+        self._update_from_coordinator()
 
     @property
     def thermostat(self) -> Thermostat | None:
         """Get the current thermostat data from coordinator."""
-        thermostats: list[Thermostat] = self.coordinator.data.get("thermostats", [])
-        return next((t for t in thermostats if t.device_id == self._device_id), None)
+        return self.coordinator.get_thermostat(self._device_id)
+
+    async def async_added_to_hass(self) -> None:
+        """Register as a consumer of thermostat configuration values."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_config_consumer())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Nothing to do if this device did not change in the last update
+        changed = self.coordinator.changed_device_ids
+        if changed is not None and self._device_id not in changed:
+            return
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this entity."""
+    def _update_from_coordinator(self) -> None:
+        """Snapshot the current thermostat value into the entity."""
         thermostat = self.thermostat
-        if not thermostat:
-            return {}
-        
-        return {
-            "identifiers": {(DOMAIN, thermostat.device_id)},
-            "name": thermostat.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_THERMOSTAT,
-            "sw_version": thermostat.firmware_version,
-        }
+        if thermostat is None:
+            # Thermostat vanished from the latest data, like the thermostat sensors
+            self._attr_available = False
+            return
+
+        self._attr_available = True
+
+        # The entity key is the name of the thermostat field holding the value
+        value = getattr(thermostat, self._key)
+        if self._integer_value and value is not None:
+            value = float(value)
+        self._attr_native_value = value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
+        device_num = self._device_num
+        if device_num is None:
+            _LOGGER.error(
+                "Failed to extract device number from %s",
+                self._device_id,
+            )
+            return
+
         # Validate brightness range (0-30 for Controme)
         if self._key == "display_brightness" and value > 30:
             _LOGGER.warning(
@@ -100,80 +136,30 @@ class ContromeNumberBase(CoordinatorEntity, NumberEntity):
             value,
         )
 
-        # Extract device number from device_id (RFAktor*1 -> 1)
-        try:
-            device_num = int(self._device_id.split('*')[1])
-        except (IndexError, ValueError) as err:
-            _LOGGER.error(
-                "Failed to extract device number from %s: %s",
-                self._device_id,
-                err,
-            )
-            return
-
-        # Get the parameter name for this entity type
-        param_name = self._get_parameter_name()
-        if not param_name:
-            _LOGGER.error("Unknown parameter name for key %s", self._key)
-            return
-
-        # Call the web_client method
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.controller.web_client.set_thermostat_parameter,
-            device_num,
-            param_name,
-            str(int(value)) if isinstance(value, float) else str(value),
+        # Queue the write; the coordinator sends queued writes in batches and
+        # refreshes afterwards
+        if self._integer_value:
+            value = int(value)
+        self.coordinator.queue_parameter_write(
+            device_num, self._param_name, self._value_fmt.format(value)
+        )
+        _LOGGER.info(
+            "Queued update of %s to %s (changes may take up to 60 seconds to appear on device)",
+            self._key,
+            value,
         )
 
-        if success:
-            _LOGGER.info(
-                "Successfully updated %s to %s (changes may take up to 60 seconds to appear on device)",
-                self._key,
-                value,
-            )
-            # Track last change time for cooldown
-            from datetime import datetime
-            self._last_change_time = datetime.now()
-            
-            # Request coordinator update after a short delay
-            await self.coordinator.async_request_refresh()
-            
-            # Schedule re-enabling after 60 seconds
-            self.async_write_ha_state()
-        else:
-            _LOGGER.error(
-                "Failed to update %s for thermostat %s",
-                self._key,
-                self._device_id,
-            )
-
-    def _get_parameter_name(self) -> str | None:
-        """Get the Controme API parameter name for this entity."""
-        # Map entity keys to Controme API parameter names
-        param_map = {
-            "sensor_offset": "sensorOffset",
-            "display_brightness": "dispBright",
-            "send_interval": "sendInterval",
-            "deviation": "deviation",
-            "force_send_count": "forceSendCount",
-        }
-        return param_map.get(self._key)
+        # Show the new value right away; the refresh after the write overwrites it
+        # if the device disagrees
+        thermostat = self.thermostat
+        if thermostat is not None:
+            setattr(thermostat, self._key, value)
+            self.coordinator.async_notify_thermostat_changed(self._device_id)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Check coordinator availability first
-        if not super().available:
-            return False
-        
-        # During cooldown period (60 seconds after change), entity is not available
-        if self._last_change_time:
-            from datetime import datetime, timedelta
-            elapsed = datetime.now() - self._last_change_time
-            if elapsed < timedelta(seconds=60):
-                return False
-        
-        return True
+        return super().available and self._attr_available
 
 
 class ContromeSensorOffset(ContromeNumberBase):
@@ -182,6 +168,9 @@ class ContromeSensorOffset(ContromeNumberBase):
     Note: Changes may take up to 60 seconds to appear on the physical device.
     """
 
+    _param_name = "sensorOffset"
+    _value_fmt = "{:.1f}"
+    _integer_value = False
     _attr_native_min_value = -5.0
     _attr_native_max_value = 5.0
     _attr_native_step = 0.1
@@ -198,12 +187,6 @@ class ContromeSensorOffset(ContromeNumberBase):
         """Initialize the sensor offset entity."""
         super().__init__(coordinator, device_id, "sensor_offset", "Sensor Offset")
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        thermostat = self.thermostat
-        return thermostat.sensor_offset if thermostat else None
-
 
 class ContromeDisplayBrightness(ContromeNumberBase):
     """Number entity for thermostat display brightness.
@@ -212,6 +195,7 @@ class ContromeDisplayBrightness(ContromeNumberBase):
     due to the RF communication interval.
     """
 
+    _param_name = "dispBright"
     _attr_native_min_value = 0
     _attr_native_max_value = 30
     _attr_native_step = 1
@@ -227,16 +211,11 @@ class ContromeDisplayBrightness(ContromeNumberBase):
         """Initialize the display brightness entity."""
         super().__init__(coordinator, device_id, "display_brightness", "Display Brightness")
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        thermostat = self.thermostat
-        return float(thermostat.display_brightness) if thermostat else None
-
 
 class ContromeSendInterval(ContromeNumberBase):
     """Number entity for thermostat send interval."""
 
+    _param_name = "sendInterval"
     _attr_native_min_value = 60
     _attr_native_max_value = 3600
     _attr_native_step = 60
@@ -252,16 +231,13 @@ class ContromeSendInterval(ContromeNumberBase):
         """Initialize the send interval entity."""
         super().__init__(coordinator, device_id, "send_interval", "Send Interval")
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        thermostat = self.thermostat
-        return float(thermostat.send_interval) if thermostat else None
-
 
 class ContromeDeviation(ContromeNumberBase):
     """Number entity for temperature change threshold."""
 
+    _param_name = "deviation"
+    _value_fmt = "{:.1f}"
+    _integer_value = False
     _attr_native_min_value = 0.0
     _attr_native_max_value = 0.5
     _attr_native_step = 0.1
@@ -277,16 +253,11 @@ class ContromeDeviation(ContromeNumberBase):
         """Initialize the deviation entity."""
         super().__init__(coordinator, device_id, "deviation", "Temperature Deviation")
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        thermostat = self.thermostat
-        return thermostat.deviation if thermostat else None
-
 
 class ContromeForceSendCount(ContromeNumberBase):
     """Number entity for force send count."""
 
+    _param_name = "forceSendCount"
     _attr_native_min_value = 0
     _attr_native_max_value = 10
     _attr_native_step = 1
@@ -301,8 +272,12 @@ class ContromeForceSendCount(ContromeNumberBase):
         """Initialize the force send count entity."""
         super().__init__(coordinator, device_id, "force_send_count", "Force Send Count")
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        thermostat = self.thermostat
-        return float(thermostat.force_send_count) if thermostat else None
+
+# Number entities created for each thermostat
+_NUMBER_CLASSES: tuple[type[ContromeNumberBase], ...] = (
+    ContromeSensorOffset,
+    ContromeDisplayBrightness,
+    ContromeSendInterval,
+    ContromeDeviation,
+    ContromeForceSendCount,
+)
@@ -1,21 +1,35 @@
 """Select platform for Controme Smart-Heat-OS integration."""
 from __future__ import annotations
 
+from abc import abstractmethod
+from collections.abc import Sequence
 import logging
-from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL_THERMOSTAT
+from .const import DOMAIN
 from .coordinator import ContromeDataUpdateCoordinator
+from .entity import thermostat_device_info
 from controme_scraper.models import Thermostat
 
 _LOGGER = logging.getLogger(__name__)
 
+# Option lists are shared by all entities of a type
+_DEVICE_TYPE_OPTIONS = (
+    "undef",
+    "hktGenius",
+    "hkt",
+    "hktControme",
+    "hkteTRV",
+)
+# Room option and API value for thermostats without a room
+_NOT_ASSIGNED = "Not Assigned"
+_NOT_ASSIGNED_VALUE = "undef"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,15 +40,18 @@ async def async_setup_entry(
     coordinator: ContromeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Create select entities for each thermostat
-    entities = []
-    thermostats: list[Thermostat] = coordinator.data.get("thermostats", [])
-    
-    for thermostat in thermostats:
-        # 2 select entities per thermostat
-        entities.append(ContromeDeviceType(coordinator, thermostat.device_id))
-        entities.append(ContromeRoomAssignment(coordinator, thermostat.device_id))
+    thermostats = coordinator.thermostats
+    if not thermostats:
+        _LOGGER.debug("No thermostats found, skipping Controme select entities")
+        return
+
+    entities = [
+        select_class(coordinator, thermostat.device_id)
+        for thermostat in thermostats
+        for select_class in _SELECT_CLASSES
+    ]
     
-    _LOGGER.info("Setting up %d Controme select entities", len(entities))
+    _LOGGER.debug("Setting up %d Controme select entities", len(entities))
     async_add_entities(entities)
 
 
@@ -42,6 +59,13 @@ class ContromeSelectBase(CoordinatorEntity, SelectEntity):
     """Base class for Controme select entities."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    # Controme API parameter names by entity key
+    _PARAM_MAP = {
+        "device_type": "deviceType",
+        "room_assignment": "roomID",
+    }
 
     def __init__(
         self,
@@ -49,40 +73,68 @@ class ContromeSelectBase(CoordinatorEntity, SelectEntity):
         device_id: str,
         key: str,
         name: str,
-        options: list[str],
+        options: Sequence[str],
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=device_id)
         self._device_id = device_id
         self._key = key
-        self._attr_unique_id = f"controme_{device_id.replace('*', '_')}_{key}"
+        self._sanitized_id = device_id.replace('*', '_')
+        self._attr_unique_id = f"controme_{self._sanitized_id}_{key}"
         self._attr_name = name
+        self._attr_device_info = thermostat_device_info(coordinator, device_id)
         self._attr_options = options
-        self._last_change_time = None
+        self._options_set = frozenset(options)
+
+        # Extract device number from device_id (RFAktor*1 -> 1)
+        try:
+            self._device_num: int | None = int(device_id.split('*', 1)[1])
+        except (IndexError, ValueError):
+            self._device_num = None
+        self._last_written_state: tuple[str | None, bool] | None = None
 
     @property
     def thermostat(self) -> Thermostat | None:
         """Get the current thermostat data from coordinator."""
-        thermostats: list[Thermostat] = self.coordinator.data.get("thermostats", [])
-        return next((t for t in thermostats if t.device_id == self._device_id), None)
+        return self.coordinator.get_thermostat(self._device_id)
+
+    async def async_added_to_hass(self) -> None:
+        """Register as a consumer of thermostat configuration values."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_config_consumer())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the selected option or availability changed."""
+        # Nothing to do if this device did not change since the last written state
+        changed = self.coordinator.changed_device_ids
+        if (
+            changed is not None
+            and self._device_id not in changed
+            and self._last_written_state is not None
+        ):
+            return
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this entity."""
-        thermostat = self.thermostat
-        if not thermostat:
-            return {}
-        
-        return {
-            "identifiers": {(DOMAIN, thermostat.device_id)},
-            "name": thermostat.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_THERMOSTAT,
-            "sw_version": thermostat.firmware_version,
-        }
+        state = (self.current_option, self.available)
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
+        super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        device_num = self._device_num
+        if device_num is None:
+            _LOGGER.error(
+                "Failed to extract device number from %s",
+                self._device_id,
+            )
+            return
+
+        if option not in self._options_set:
+            _LOGGER.error("Invalid option %s for %s", option, self._key)
+            return
+
         _LOGGER.info(
             "Setting %s for thermostat %s to %s",
             self._key,
@@ -90,17 +142,6 @@ class ContromeSelectBase(CoordinatorEntity, SelectEntity):
             option,
         )
 
-        # Extract device number from device_id (RFAktor*1 -> 1)
-        try:
-            device_num = int(self._device_id.split('*')[1])
-        except (IndexError, ValueError) as err:
-            _LOGGER.error(
-                "Failed to extract device number from %s: %s",
-                self._device_id,
-                err,
-            )
-            return
-
         # Get the parameter name for this entity type
         param_name = self._get_parameter_name()
         if not param_name:
@@ -110,64 +151,34 @@ class ContromeSelectBase(CoordinatorEntity, SelectEntity):
         # Convert option to parameter value
         param_value = self._option_to_value(option)
 
-        # Call the web_client method
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.controller.web_client.set_thermostat_parameter,
-            device_num,
-            param_name,
-            param_value,
+        # Queue the write; the coordinator sends queued writes in batches and
+        # refreshes afterwards
+        self.coordinator.queue_parameter_write(device_num, param_name, param_value)
+        _LOGGER.info(
+            "Queued update of %s to %s (changes may take up to 60 seconds to appear on device)",
+            self._key,
+            option,
         )
 
-        if success:
-            _LOGGER.info(
-                "Successfully updated %s to %s (changes may take up to 60 seconds to appear on device)",
-                self._key,
-                option,
-            )
-            # Track last change time for cooldown
-            from datetime import datetime
-            self._last_change_time = datetime.now()
-            
-            # Request coordinator update after a short delay
-            await self.coordinator.async_request_refresh()
-            
-            # Schedule re-enabling after 60 seconds
-            self.async_write_ha_state()
-        else:
-            _LOGGER.error(
-                "Failed to update %s for thermostat %s",
-                self._key,
-                self._device_id,
-            )
+        # Show the new value right away; the refresh after the write overwrites it
+        # if the device disagrees
+        thermostat = self.thermostat
+        if thermostat is not None:
+            self._apply_option(thermostat, option)
+            self.coordinator.async_notify_thermostat_changed(self._device_id)
 
     def _get_parameter_name(self) -> str | None:
         """Get the Controme API parameter name for this entity."""
-        param_map = {
-            "device_type": "deviceType",
-            "room_assignment": "roomID",
-        }
-        return param_map.get(self._key)
+        return self._PARAM_MAP.get(self._key)
 
     def _option_to_value(self, option: str) -> str:
         """Convert display option to API value."""
         # Override in subclass if needed
         return option
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        # Check coordinator availability first
-        if not super().available:
-            return False
-        
-        # During cooldown period (60 seconds after change), entity is not available
-        if self._last_change_time:
-            from datetime import datetime, timedelta
-            elapsed = datetime.now() - self._last_change_time
-            if elapsed < timedelta(seconds=60):
-                return False
-        
-        return True
+    @abstractmethod
+    def _apply_option(self, thermostat: Thermostat, option: str) -> None:
+        """Apply the selected option to the cached thermostat data."""
 
 
 class ContromeDeviceType(ContromeSelectBase):
@@ -184,14 +195,9 @@ class ContromeDeviceType(ContromeSelectBase):
         device_id: str,
     ) -> None:
         """Initialize the device type entity."""
-        options = [
-            "undef",
-            "hktGenius",
-            "hkt",
-            "hktControme",
-            "hkteTRV",
-        ]
-        super().__init__(coordinator, device_id, "device_type", "Device Type", options)
+        super().__init__(
+            coordinator, device_id, "device_type", "Device Type", _DEVICE_TYPE_OPTIONS
+        )
 
     @property
     def current_option(self) -> str | None:
@@ -201,6 +207,10 @@ class ContromeDeviceType(ContromeSelectBase):
             return "undef"
         return thermostat.device_type
 
+    def _apply_option(self, thermostat: Thermostat, option: str) -> None:
+        """Apply the selected device type to the cached thermostat data."""
+        thermostat.device_type = option
+
 
 class ContromeRoomAssignment(ContromeSelectBase):
     """Select entity for room assignment.
@@ -216,30 +226,58 @@ class ContromeRoomAssignment(ContromeSelectBase):
         device_id: str,
     ) -> None:
         """Initialize the room assignment entity."""
-        # Get available rooms from coordinator data
-        # This should be fetched from the actual Controme system
-        # For now, using static list based on analysis
-        options = [
-            "Not Assigned",
-            "Wohnzimmer",
-            "Schlafzimmer",
-            "Badezimmer",
-            "Zimmer Paulina",
-            "Zimmer Sophia",
-            "Gästezimmer",
-            "Büro",
-        ]
-        super().__init__(coordinator, device_id, "room_assignment", "Room Assignment", options)
+        # Options are built from the rooms reported by the Controme system
+        self._room_ids: dict[str, int] = coordinator.data.get("room_ids_by_name", {})
+        super().__init__(
+            coordinator,
+            device_id,
+            "room_assignment",
+            "Room Assignment",
+            [_NOT_ASSIGNED, *self._room_ids],
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the room options when the rooms changed."""
+        room_ids = self.coordinator.data.get("room_ids_by_name", {})
+        if room_ids is not self._room_ids:
+            self._room_ids = room_ids
+            options = [_NOT_ASSIGNED, *room_ids]
+            if options != self._attr_options:
+                self._attr_options = options
+                self._options_set = frozenset(options)
+                # Force a state write so the new options are published
+                self._last_written_state = None
+        super()._handle_coordinator_update()
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
         thermostat = self.thermostat
         if not thermostat:
-            return "Not Assigned"
+            return _NOT_ASSIGNED
         
         # Map room_id to room name
-        if thermostat.room_name:
-            return thermostat.room_name
-        
-        return "Not Assigned"
+        return self.coordinator.data.get("room_id_to_name", {}).get(
+            thermostat.assigned_room_id, _NOT_ASSIGNED
+        )
+
+    def _option_to_value(self, option: str) -> str:
+        """Convert the room name to the room id expected by the API."""
+        room_id = self._room_ids.get(option)
+        if room_id is None:
+            return _NOT_ASSIGNED_VALUE
+        return str(room_id)
+
+    def _apply_option(self, thermostat: Thermostat, option: str) -> None:
+        """Apply the selected room to the cached thermostat data."""
+        room_id = self._room_ids.get(option)
+        thermostat.assigned_room_id = room_id
+        thermostat.room_name = option if room_id is not None else None
+
+
+# Select entities created for each thermostat
+_SELECT_CLASSES: tuple[type[ContromeSelectBase], ...] = (
+    ContromeDeviceType,
+    ContromeRoomAssignment,
+)
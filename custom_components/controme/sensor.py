@@ -1,6 +1,8 @@
 """Sensor platform for Controme Smart-Heat-OS integration."""
 from __future__ import annotations
 
+from abc import abstractmethod
+from bisect import bisect_right
 import logging
 from typing import Any
 
@@ -11,7 +13,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -24,10 +26,16 @@ from .const import (
     MODEL_GATEWAY,
 )
 from .coordinator import ContromeDataUpdateCoordinator
-from controme_scraper.models import Gateway
+from .entity import thermostat_device_info
+from controme_scraper.models import Thermostat
 
 _LOGGER = logging.getLogger(__name__)
 
+# Heating demand icons, picked by where the average valve position falls
+# between the thresholds
+_GAUGE_THRESHOLDS = (10, 30, 70)
+_GAUGE_ICONS = ("mdi:gauge-empty", "mdi:gauge-low", "mdi:gauge", "mdi:gauge-full")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,125 +54,168 @@ async def async_setup_entry(
         ContromeRoomsLowDemandSensor(coordinator),
     ]
 
-    # Create valve position sensors for each thermostat
-    thermostats = coordinator.data.get("thermostats", [])
+    # Create valve position and return flow temperature sensors for each thermostat
+    thermostats = coordinator.thermostats
     for thermostat in thermostats:
-        if thermostat.valve_positions:
+        device_id = thermostat.device_id
+        # Shared by the unique ids of all sensors of this thermostat
+        sanitized_id = device_id.replace('*', '_')
+        valve_positions = thermostat.valve_positions
+        return_flow_temperatures = thermostat.return_flow_temperatures
+
+        if valve_positions:
             # Create average valve position sensor per room
             entities.append(
-                ContromeRoomAverageValvePositionSensor(coordinator, thermostat.device_id)
+                ContromeRoomAverageValvePositionSensor(coordinator, device_id, sanitized_id)
             )
             
-            # Create sensor for each valve assigned to this thermostat
-            for idx, _ in enumerate(thermostat.valve_positions):
-                entities.append(
-                    ContromeValvePositionSensor(coordinator, thermostat.device_id, idx)
+            # Create sensor for each valve assigned to this thermostat; sensors of
+            # slots without a position stay registered and report unavailable
+            valve_count = len(valve_positions)
+            entities.extend(
+                ContromeValvePositionSensor(
+                    coordinator, device_id, sanitized_id, idx, valve_count
                 )
-    
-    # Create return flow temperature sensors assigned to thermostats
-    for thermostat in thermostats:
-        if thermostat.return_flow_temperatures:
-            for idx, temp in enumerate(thermostat.return_flow_temperatures):
-                if temp is not None:
-                    entities.append(
-                        ContromeReturnFlowTemperatureSensor(
-                            coordinator, 
-                            thermostat.device_id, 
-                            idx
-                        )
-                    )
+                for idx in range(valve_count)
+            )
+        
+        # Create return flow temperature sensors assigned to this thermostat
+        if return_flow_temperatures:
+            temp_count = len(return_flow_temperatures)
+            entities.extend(
+                ContromeReturnFlowTemperatureSensor(
+                    coordinator, device_id, sanitized_id, idx, temp_count
+                )
+                for idx, temp in enumerate(return_flow_temperatures)
+                if temp is not None
+            )
 
     _LOGGER.info("Setting up %d Controme sensor entities", len(entities))
     async_add_entities(entities)
 
 
-class ContromeSystemHeatingDemandSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for overall system heating demand (average valve position)."""
+class ContromeSensorBase(CoordinatorEntity, SensorEntity):
+    """Base class for Controme sensor entities."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    # Attributes built from the current coordinator data, reset on every update
+    _attrs_cache: dict[str, Any] | None = None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes, built once per coordinator update."""
+        if self._attrs_cache is None:
+            self._attrs_cache = self._build_extra_state_attributes()
+        return self._attrs_cache
+
+    @abstractmethod
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attrs_cache = None
+        super()._handle_coordinator_update()
+
+
+class ContromeGatewaySensorBase(ContromeSensorBase):
+    """Base class for sensors linked to the Controme gateway device."""
+
+    def __init__(self, coordinator: ContromeDataUpdateCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.gateway_id)},
+            "name": coordinator.gateway_name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL_GATEWAY,
+        }
+
+
+class ContromeThermostatSensorBase(ContromeSensorBase):
+    """Base class for sensors linked to a thermostat device."""
+
+    def __init__(
+        self,
+        coordinator: ContromeDataUpdateCoordinator,
+        device_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, context=device_id)
+        self._device_id = device_id
+        self._attr_device_info = thermostat_device_info(coordinator, device_id)
+        self._thermostat: Thermostat | None = None
+        self._update_from_coordinator()
+
+    def _get_thermostat(self) -> Thermostat | None:
+        """Get the thermostat resolved at the last coordinator update."""
+        return self._thermostat
+
+    def _update_from_coordinator(self) -> None:
+        """Resolve the thermostat and derived values, once per coordinator update."""
+        self._thermostat = self.coordinator.get_thermostat(self._device_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Nothing to do if this device did not change in the last update
+        changed = self.coordinator.changed_device_ids
+        if changed is not None and self._device_id not in changed:
+            return
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+
+class ContromeSystemHeatingDemandSensor(ContromeGatewaySensorBase):
+    """Sensor for overall system heating demand (average valve position)."""
+
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:gauge"
 
     def __init__(self, coordinator: ContromeDataUpdateCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"controme_system_heating_demand"
         self._attr_name = "System Heating Demand"
-
-    @property
-    def gateway(self) -> Gateway | None:
-        """Get the gateway data from coordinator."""
-        return self.coordinator.data.get("gateway")
+        self._update_icon()
 
     @property
     def native_value(self) -> float | None:
         """Return the system average valve position."""
-        # Calculate from thermostats
-        thermostats = self.coordinator.data.get("thermostats", [])
-        all_positions = []
-        for t in thermostats:
-            if t.valve_positions:
-                all_positions.extend(t.valve_positions)
-        
-        if all_positions:
-            return int(sum(all_positions) / len(all_positions))
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        gateway = self.gateway
-        if not gateway:
-            return {}
+        return self.coordinator.data["_agg"]["sys_avg"]
 
-        return {
-            "identifiers": {(DOMAIN, gateway.gateway_id)},
-            "name": gateway.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_GATEWAY,
-        }
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        
-        # Count active heating thermostats
-        active_heating = sum(1 for t in thermostats if t.is_heating)
+        thermostats = self.coordinator.thermostats
         
         return {
             "total_thermostats": len(thermostats),
-            "active_heating_thermostats": active_heating,
+            "active_heating_thermostats": self.coordinator.data["_agg"]["active_heating"],
         }
 
-    @property
-    def icon(self) -> str:
-        """Return dynamic icon based on heating demand."""
-        gateway = self.gateway
-        if not gateway:
-            return "mdi:gauge"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_icon()
+        super()._handle_coordinator_update()
 
-        avg = gateway.system_average_valve_position
+    def _update_icon(self) -> None:
+        """Set the icon based on heating demand, once per coordinator update."""
+        avg = self.coordinator.data["_agg"]["sys_avg"]
         if avg is None:
-            return "mdi:gauge"
-        elif avg < 10:
-            return "mdi:gauge-empty"
-        elif avg < 30:
-            return "mdi:gauge-low"
-        elif avg < 70:
-            return "mdi:gauge"
+            self._attr_icon = "mdi:gauge"
         else:
-            return "mdi:gauge-full"
+            self._attr_icon = _GAUGE_ICONS[bisect_right(_GAUGE_THRESHOLDS, avg)]
 
 
-class ContromeActiveHeatingRoomsSensor(CoordinatorEntity, SensorEntity):
+class ContromeActiveHeatingRoomsSensor(ContromeGatewaySensorBase):
     """Sensor for number of thermostats currently heating."""
 
-    _attr_has_entity_name = True
     _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:home-thermometer"
 
     def __init__(self, coordinator: ContromeDataUpdateCoordinator) -> None:
@@ -173,131 +224,82 @@ class ContromeActiveHeatingRoomsSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"controme_active_heating_thermostats"
         self._attr_name = "Active Heating Thermostats"
 
-    @property
-    def gateway(self) -> Gateway | None:
-        """Get the gateway data from coordinator."""
-        return self.coordinator.data.get("gateway")
-
     @property
     def native_value(self) -> int | None:
         """Return the number of thermostats actively heating."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        return sum(1 for t in thermostats if t.is_heating)
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        gateway = self.gateway
-        if not gateway:
-            return {}
+        return self.coordinator.data["_agg"]["active_heating"]
 
-        return {
-            "identifiers": {(DOMAIN, gateway.gateway_id)},
-            "name": gateway.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_GATEWAY,
-        }
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        thermostats = self.coordinator.data.get("thermostats", [])
+        thermostats = self.coordinator.thermostats
         
         return {
             "total_thermostats": len(thermostats),
         }
 
 
-class ContromeRoomAverageValvePositionSensor(CoordinatorEntity, SensorEntity):
+class ContromeRoomAverageValvePositionSensor(ContromeThermostatSensorBase):
     """Sensor for average valve position per room (thermostat)."""
 
-    _attr_has_entity_name = True
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:gauge"
 
     def __init__(
         self,
         coordinator: ContromeDataUpdateCoordinator,
         device_id: str,
+        sanitized_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._attr_unique_id = f"controme_{device_id.replace('*', '_')}_avg_valve_position"
+        super().__init__(coordinator, device_id)
+        self._attr_unique_id = f"controme_{sanitized_id}_avg_valve_position"
         self._attr_name = "Average Valve Position"
 
-    def _get_thermostat(self):
-        """Get the thermostat from coordinator data."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        return next((t for t in thermostats if t.device_id == self._device_id), None)
-
     @property
     def native_value(self) -> float | None:
         """Return the average valve position for this room."""
-        thermostat = self._get_thermostat()
-        if not thermostat or not thermostat.valve_positions:
+        room_avg = self.coordinator.data["_agg"]["room_avgs"].get(self._device_id)
+        if room_avg is None:
             return None
-        
-        # Calculate average of all valves in this room
-        valid_positions = [p for p in thermostat.valve_positions if p is not None]
-        if valid_positions:
-            return round(sum(valid_positions) / len(valid_positions), 1)
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information - link to thermostat device."""
-        from .const import MODEL_THERMOSTAT
-        thermostat = self._get_thermostat()
-        if not thermostat:
-            return {}
-
-        return {
-            "identifiers": {(DOMAIN, thermostat.device_id)},
-            "name": thermostat.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_THERMOSTAT,
-            "sw_version": thermostat.firmware_version,
-            "suggested_area": thermostat.room_name or thermostat.floor_name,
-        }
+        return round(room_avg, 1)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         thermostat = self._get_thermostat()
         if not thermostat:
             return {}
 
+        valve_positions = thermostat.valve_positions
         attrs = {
             "device_id": self._device_id,
             "thermostat_name": thermostat.name,
-            "total_valves": len(thermostat.valve_positions) if thermostat.valve_positions else 0,
+            "total_valves": len(valve_positions) if valve_positions else 0,
             "is_heating": thermostat.is_heating,
         }
         
         # Add individual valve positions for reference
-        if thermostat.valve_positions:
-            for idx, pos in enumerate(thermostat.valve_positions):
-                attrs[f"valve_{idx + 1}_position"] = pos
+        valve_attrs = self.coordinator.data["_agg"]["valve_attrs"].get(self._device_id)
+        if valve_attrs:
+            attrs.update(valve_attrs)
         
         return attrs
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        thermostat = self._get_thermostat()
+        # HA skips value/attributes while updates are failing
+        if not super().available:
+            return False
+        thermostat = self._thermostat
         return bool(thermostat and thermostat.valve_positions)
 
 
-class ContromeRoomBasedHeatingDemandSensor(CoordinatorEntity, SensorEntity):
+class ContromeRoomBasedHeatingDemandSensor(ContromeGatewaySensorBase):
     """Sensor for system heating demand based on room averages (not individual valves)."""
 
-    _attr_has_entity_name = True
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:gauge"
 
     def __init__(self, coordinator: ContromeDataUpdateCoordinator) -> None:
@@ -306,47 +308,14 @@ class ContromeRoomBasedHeatingDemandSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"controme_room_based_heating_demand"
         self._attr_name = "Room-Based Heating Demand"
 
-    @property
-    def gateway(self) -> Gateway | None:
-        """Get the gateway data from coordinator."""
-        return self.coordinator.data.get("gateway")
-
     @property
     def native_value(self) -> float | None:
         """Return the average of all room average valve positions."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        room_averages = []
-        
-        for t in thermostats:
-            if t.valve_positions:
-                # Calculate average for this room
-                valid_positions = [p for p in t.valve_positions if p is not None]
-                if valid_positions:
-                    room_avg = sum(valid_positions) / len(valid_positions)
-                    room_averages.append(room_avg)
-        
-        if room_averages:
-            return round(sum(room_averages) / len(room_averages), 1)
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        gateway = self.gateway
-        if not gateway:
-            return {}
+        return self.coordinator.data["_agg"]["room_based_avg"]
 
-        return {
-            "identifiers": {(DOMAIN, gateway.gateway_id)},
-            "name": gateway.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_GATEWAY,
-        }
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        thermostats = self.coordinator.data.get("thermostats", [])
+        thermostats = self.coordinator.thermostats
         
         attrs = {
             "total_rooms": len(thermostats),
@@ -354,23 +323,15 @@ class ContromeRoomBasedHeatingDemandSensor(CoordinatorEntity, SensorEntity):
         }
         
         # Add per-room averages for transparency
-        for t in thermostats:
-            if t.valve_positions:
-                valid_positions = [p for p in t.valve_positions if p is not None]
-                if valid_positions:
-                    room_avg = round(sum(valid_positions) / len(valid_positions), 1)
-                    safe_name = t.name.replace(" ", "_").lower()
-                    attrs[f"room_{safe_name}"] = room_avg
+        attrs.update(self.coordinator.data["_agg"]["room_avg_attrs"])
         
         return attrs
 
 
-class ContromeRoomsHighDemandSensor(CoordinatorEntity, SensorEntity):
+class ContromeRoomsHighDemandSensor(ContromeGatewaySensorBase):
     """Sensor for number of rooms with high heating demand (avg valve position >80%)."""
 
-    _attr_has_entity_name = True
     _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:fire"
 
     def __init__(self, coordinator: ContromeDataUpdateCoordinator) -> None:
@@ -379,71 +340,26 @@ class ContromeRoomsHighDemandSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"controme_rooms_high_demand"
         self._attr_name = "Rooms High Demand"
 
-    @property
-    def gateway(self) -> Gateway | None:
-        """Get the gateway data from coordinator."""
-        return self.coordinator.data.get("gateway")
-
     @property
     def native_value(self) -> int | None:
         """Return the number of rooms with average valve position >80%."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        high_demand_count = 0
-        
-        for t in thermostats:
-            if t.valve_positions:
-                valid_positions = [p for p in t.valve_positions if p is not None]
-                if valid_positions:
-                    room_avg = sum(valid_positions) / len(valid_positions)
-                    if room_avg > 80:
-                        high_demand_count += 1
-        
-        return high_demand_count
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        gateway = self.gateway
-        if not gateway:
-            return {}
-
-        return {
-            "identifiers": {(DOMAIN, gateway.gateway_id)},
-            "name": gateway.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_GATEWAY,
-        }
+        return self.coordinator.data["_agg"]["high_count"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        
-        high_demand_rooms = []
-        for t in thermostats:
-            if t.valve_positions:
-                valid_positions = [p for p in t.valve_positions if p is not None]
-                if valid_positions:
-                    room_avg = sum(valid_positions) / len(valid_positions)
-                    if room_avg > 80:
-                        high_demand_rooms.append({
-                            "name": t.name,
-                            "average_position": round(room_avg, 1),
-                        })
+        thermostats = self.coordinator.thermostats
         
         return {
             "total_rooms": len(thermostats),
             "threshold": 80,
-            "rooms": high_demand_rooms,
+            "rooms": self.coordinator.data["_agg"]["high_rooms"],
         }
 
 
-class ContromeRoomsLowDemandSensor(CoordinatorEntity, SensorEntity):
+class ContromeRoomsLowDemandSensor(ContromeGatewaySensorBase):
     """Sensor for number of rooms with low heating demand (avg valve position <20%)."""
 
-    _attr_has_entity_name = True
     _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:snowflake"
 
     def __init__(self, coordinator: ContromeDataUpdateCoordinator) -> None:
@@ -452,154 +368,96 @@ class ContromeRoomsLowDemandSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"controme_rooms_low_demand"
         self._attr_name = "Rooms Low Demand"
 
-    @property
-    def gateway(self) -> Gateway | None:
-        """Get the gateway data from coordinator."""
-        return self.coordinator.data.get("gateway")
-
     @property
     def native_value(self) -> int | None:
         """Return the number of rooms with average valve position <20%."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        low_demand_count = 0
-        
-        for t in thermostats:
-            if t.valve_positions:
-                valid_positions = [p for p in t.valve_positions if p is not None]
-                if valid_positions:
-                    room_avg = sum(valid_positions) / len(valid_positions)
-                    if room_avg < 20:
-                        low_demand_count += 1
-        
-        return low_demand_count
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        gateway = self.gateway
-        if not gateway:
-            return {}
-
-        return {
-            "identifiers": {(DOMAIN, gateway.gateway_id)},
-            "name": gateway.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_GATEWAY,
-        }
+        return self.coordinator.data["_agg"]["low_count"]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        
-        low_demand_rooms = []
-        for t in thermostats:
-            if t.valve_positions:
-                valid_positions = [p for p in t.valve_positions if p is not None]
-                if valid_positions:
-                    room_avg = sum(valid_positions) / len(valid_positions)
-                    if room_avg < 20:
-                        low_demand_rooms.append({
-                            "name": t.name,
-                            "average_position": round(room_avg, 1),
-                        })
+        thermostats = self.coordinator.thermostats
         
         return {
             "total_rooms": len(thermostats),
             "threshold": 20,
-            "rooms": low_demand_rooms,
+            "rooms": self.coordinator.data["_agg"]["low_rooms"],
         }
 
 
-class ContromeValvePositionSensor(CoordinatorEntity, SensorEntity):
+class ContromeValvePositionSensor(ContromeThermostatSensorBase):
     """Sensor for individual valve position assigned to a thermostat."""
 
-    _attr_has_entity_name = True
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:valve"
 
     def __init__(
         self,
         coordinator: ContromeDataUpdateCoordinator,
         device_id: str,
+        sanitized_id: str,
         valve_index: int,
+        valve_count: int,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
         self._valve_index = valve_index
-        self._attr_unique_id = f"controme_{device_id.replace('*', '_')}_valve_{valve_index}"
-        
-        # Set name based on thermostat
-        thermostat = self._get_thermostat()
-        valve_name = f"Valve {valve_index + 1}" if thermostat and len(thermostat.valve_positions or []) > 1 else "Valve"
-        self._attr_name = valve_name
-
-    def _get_thermostat(self):
-        """Get the thermostat from coordinator data."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        return next((t for t in thermostats if t.device_id == self._device_id), None)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the valve position."""
-        thermostat = self._get_thermostat()
-        if not thermostat or not thermostat.valve_positions:
-            return None
+        super().__init__(coordinator, device_id)
+        self._attr_unique_id = f"controme_{sanitized_id}_valve_{valve_index}"
         
-        if self._valve_index < len(thermostat.valve_positions):
-            return thermostat.valve_positions[self._valve_index]
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information - link to thermostat device."""
-        from .const import MODEL_THERMOSTAT
-        thermostat = self._get_thermostat()
-        if not thermostat:
-            return {}
-
-        return {
-            "identifiers": {(DOMAIN, thermostat.device_id)},
-            "name": thermostat.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_THERMOSTAT,
-            "sw_version": thermostat.firmware_version,
-            "suggested_area": thermostat.room_name or thermostat.floor_name,
-        }
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+        # Set name based on number of valves
+        self._attr_name = f"Valve {valve_index + 1}" if valve_count > 1 else "Valve"
+
+    def _update_from_coordinator(self) -> None:
+        """Resolve the thermostat and this valve's position."""
+        super()._update_from_coordinator()
+        thermostat = self._thermostat
+        valve_positions = (thermostat.valve_positions if thermostat else None) or ()
+        position = (
+            valve_positions[self._valve_index]
+            if self._valve_index < len(valve_positions)
+            else None
+        )
+        # Slots without a position are unavailable until they report one
+        self._has_valve = position is not None
+        self._attr_native_value = position
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         thermostat = self._get_thermostat()
         if not thermostat:
             return {}
 
+        # Read each list once and bounds-check each index once
+        valve_index = self._valve_index
+        valve_positions = thermostat.valve_positions or ()
+        max_valve_positions = thermostat.max_valve_positions or ()
+        return_flow_temperatures = thermostat.return_flow_temperatures or ()
+        total_valves = len(valve_positions)
+
         attrs = {
             "device_id": self._device_id,
             "thermostat_name": thermostat.name,
         }
         
         # Add max position if available (hydraulic balancing limit)
-        if thermostat.max_valve_positions and self._valve_index < len(thermostat.max_valve_positions):
-            max_position = thermostat.max_valve_positions[self._valve_index]
+        if valve_index < len(max_valve_positions):
+            max_position = max_valve_positions[valve_index]
             attrs["max_position"] = max_position
             
             # Calculate relative position (current / max * 100)
-            if thermostat.valve_positions and self._valve_index < len(thermostat.valve_positions):
-                current_position = thermostat.valve_positions[self._valve_index]
-                if max_position > 0:
-                    relative_position = round((current_position / max_position) * 100, 1)
-                    attrs["relative_position"] = relative_position
+            if valve_index < total_valves and max_position > 0:
+                current_position = valve_positions[valve_index]
+                if current_position is not None:
+                    attrs["relative_position"] = round(
+                        (current_position / max_position) * 100, 1
+                    )
         
-        attrs["valve_index"] = self._valve_index
-        attrs["total_valves"] = len(thermostat.valve_positions) if thermostat.valve_positions else 0
+        attrs["valve_index"] = valve_index
+        attrs["total_valves"] = total_valves
         
         # Add return flow temperature if available
-        if thermostat.return_flow_temperatures and self._valve_index < len(thermostat.return_flow_temperatures):
-            return_temp = thermostat.return_flow_temperatures[self._valve_index]
+        if valve_index < len(return_flow_temperatures):
+            return_temp = return_flow_temperatures[valve_index]
             if return_temp is not None:
                 attrs["return_flow_temperature"] = return_temp
         
@@ -608,96 +466,67 @@ class ContromeValvePositionSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        thermostat = self._get_thermostat()
-        if not thermostat or not thermostat.valve_positions:
-            return False
-        return self._valve_index < len(thermostat.valve_positions)
+        return self._has_valve and super().available
 
 
-class ContromeReturnFlowTemperatureSensor(CoordinatorEntity, SensorEntity):
+class ContromeReturnFlowTemperatureSensor(ContromeThermostatSensorBase):
     """Sensor for return flow temperature monitoring assigned to a thermostat."""
 
-    _attr_has_entity_name = True
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:thermometer-water"
 
     def __init__(
         self,
         coordinator: ContromeDataUpdateCoordinator,
         device_id: str,
+        sanitized_id: str,
         temp_index: int,
+        temp_count: int,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
         self._temp_index = temp_index
-        self._attr_unique_id = f"controme_{device_id.replace('*', '_')}_return_flow_{temp_index}"
+        super().__init__(coordinator, device_id)
+        self._attr_unique_id = f"controme_{sanitized_id}_return_flow_{temp_index}"
         
         # Set name based on number of valves
-        thermostat = self._get_thermostat()
-        if thermostat and thermostat.return_flow_temperatures and len(thermostat.return_flow_temperatures) > 1:
+        if temp_count > 1:
             self._attr_name = f"Return Flow {temp_index + 1}"
         else:
             self._attr_name = "Return Flow"
 
-    def _get_thermostat(self):
-        """Get the thermostat from coordinator data."""
-        thermostats = self.coordinator.data.get("thermostats", [])
-        return next((t for t in thermostats if t.device_id == self._device_id), None)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the return flow temperature."""
-        thermostat = self._get_thermostat()
-        if not thermostat or not thermostat.return_flow_temperatures:
-            return None
-        
-        if self._temp_index < len(thermostat.return_flow_temperatures):
-            return thermostat.return_flow_temperatures[self._temp_index]
-        return None
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information - link to thermostat device."""
-        from .const import MODEL_THERMOSTAT
-        thermostat = self._get_thermostat()
-        if not thermostat:
-            return {}
-
-        return {
-            "identifiers": {(DOMAIN, thermostat.device_id)},
-            "name": thermostat.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_THERMOSTAT,
-            "sw_version": thermostat.firmware_version,
-            "suggested_area": thermostat.room_name or thermostat.floor_name,
-        }
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _update_from_coordinator(self) -> None:
+        """Resolve the thermostat and this return flow temperature."""
+        super()._update_from_coordinator()
+        thermostat = self._thermostat
+        temperatures = (thermostat.return_flow_temperatures if thermostat else None) or ()
+        self._has_temp = self._temp_index < len(temperatures)
+        self._attr_native_value = (
+            temperatures[self._temp_index] if self._has_temp else None
+        )
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         thermostat = self._get_thermostat()
         if not thermostat:
             return {}
 
+        temp_index = self._temp_index
+        valve_positions = thermostat.valve_positions or ()
+
         attrs = {
             "device_id": self._device_id,
             "thermostat_name": thermostat.name,
-            "temp_index": self._temp_index,
+            "temp_index": temp_index,
         }
         
         # Add corresponding valve position if available
-        if thermostat.valve_positions and self._temp_index < len(thermostat.valve_positions):
-            attrs["valve_position"] = thermostat.valve_positions[self._temp_index]
+        if temp_index < len(valve_positions):
+            attrs["valve_position"] = valve_positions[temp_index]
         
         return attrs
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        thermostat = self._get_thermostat()
-        if not thermostat or not thermostat.return_flow_temperatures:
-            return False
-        return self._temp_index < len(thermostat.return_flow_temperatures)
+        return self._has_temp and super().available
@@ -6,12 +6,13 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL_THERMOSTAT
+from .const import DOMAIN
 from .coordinator import ContromeDataUpdateCoordinator
+from .entity import thermostat_device_info
 from controme_scraper.models import Thermostat
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,15 +27,12 @@ async def async_setup_entry(
     coordinator: ContromeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Create switch entities for each thermostat
-    entities = []
-    thermostats: list[Thermostat] = coordinator.data.get("thermostats", [])
-    
-    for thermostat in thermostats:
-        # 4 switch entities per thermostat
-        entities.append(ContromeLock(coordinator, thermostat.device_id))
-        entities.append(ContromeMainSensor(coordinator, thermostat.device_id))
-        entities.append(ContromeTempModeTemporary(coordinator, thermostat.device_id))
-        entities.append(ContromeBatterySavingMode(coordinator, thermostat.device_id))
+    thermostats = coordinator.thermostats
+    entities = [
+        switch_class(coordinator, thermostat.device_id)
+        for thermostat in thermostats
+        for switch_class in _SWITCH_CLASSES
+    ]
     
     _LOGGER.info("Setting up %d Controme switch entities", len(entities))
     async_add_entities(entities)
@@ -44,6 +42,10 @@ class ContromeSwitchBase(CoordinatorEntity, SwitchEntity):
     """Base class for Controme switch entities."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    # Controme API parameter name, set by each subclass
+    _param_name: str
 
     def __init__(
         self,
@@ -55,40 +57,60 @@ class ContromeSwitchBase(CoordinatorEntity, SwitchEntity):
         icon_off: str,
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=device_id)
         self._device_id = device_id
         self._key = key
         self._attr_unique_id = f"controme_{device_id.replace('*', '_')}_{key}"
         self._attr_name = name
+        self._attr_device_info = thermostat_device_info(coordinator, device_id)
         self._icon_on = icon_on
         self._icon_off = icon_off
-        self._last_change_time = None
+
+        # Extract device number from device_id (RFAktor*1 -> 1)
+        try:
+            self._device_num: int | None = int(device_id.split('*', 1)[1])
+        except (IndexError, ValueError):
+            self._device_num = None
+
+        self._update_from_coordinator()
 
     @property
     def thermostat(self) -> Thermostat | None:
         """Get the current thermostat data from coordinator."""
-        thermostats: list[Thermostat] = self.coordinator.data.get("thermostats", [])
-        return next((t for t in thermostats if t.device_id == self._device_id), None)
+        return self.coordinator.get_thermostat(self._device_id)
+
+    async def async_added_to_hass(self) -> None:
+        """Register as a consumer of thermostat configuration values."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_config_consumer())
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information about this entity."""
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Nothing to do if this device did not change in the last update
+        changed = self.coordinator.changed_device_ids
+        if changed is not None and self._device_id not in changed:
+            return
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Snapshot the current thermostat state into the entity."""
         thermostat = self.thermostat
-        if not thermostat:
-            return {}
-        
-        return {
-            "identifiers": {(DOMAIN, thermostat.device_id)},
-            "name": thermostat.name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL_THERMOSTAT,
-            "sw_version": thermostat.firmware_version,
-        }
+        if thermostat is None:
+            # Thermostat vanished from the latest data, like the thermostat sensors
+            self._attr_available = False
+            return
 
-    @property
-    def icon(self) -> str:
-        """Return the icon based on state."""
-        return self._icon_on if self.is_on else self._icon_off
+        self._attr_available = True
+        # The entity key is the name of the thermostat field holding the state
+        self._attr_is_on = getattr(thermostat, self._key)
+        self._attr_icon = self._icon_on if self._attr_is_on else self._icon_off
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -110,82 +132,31 @@ class ContromeSwitchBase(CoordinatorEntity, SwitchEntity):
 
     async def _async_set_value(self, value: bool) -> None:
         """Set the switch value."""
-        # Extract device number from device_id (RFAktor*1 -> 1)
-        try:
-            device_num = int(self._device_id.split('*')[1])
-        except (IndexError, ValueError) as err:
+        device_num = self._device_num
+        if device_num is None:
             _LOGGER.error(
-                "Failed to extract device number from %s: %s",
+                "Failed to extract device number from %s",
                 self._device_id,
-                err,
             )
             return
 
-        # Get the parameter name for this entity type
-        param_name = self._get_parameter_name()
-        if not param_name:
-            _LOGGER.error("Unknown parameter name for key %s", self._key)
-            return
-
-        # Convert boolean to string ("checked" for True, "" for False)
-        param_value = "checked" if value else ""
-
-        # Call the web_client method
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.controller.web_client.set_thermostat_parameter,
-            device_num,
-            param_name,
-            param_value,
+        # Queue the write ("checked" for True, "" for False); the coordinator sends
+        # queued writes in one executor job and refreshes afterwards
+        self.coordinator.queue_parameter_write(
+            device_num, self._param_name, "checked" if value else ""
+        )
+        _LOGGER.info(
+            "Queued update of %s to %s (changes may take up to 60 seconds to appear on device)",
+            self._key,
+            value,
         )
 
-        if success:
-            _LOGGER.info(
-                "Successfully updated %s to %s (changes may take up to 60 seconds to appear on device)",
-                self._key,
-                value,
-            )
-            # Track last change time for cooldown
-            from datetime import datetime
-            self._last_change_time = datetime.now()
-            
-            # Request coordinator update after a short delay
-            await self.coordinator.async_request_refresh()
-            
-            # Schedule re-enabling after 60 seconds
-            self.async_write_ha_state()
-        else:
-            _LOGGER.error(
-                "Failed to update %s for thermostat %s",
-                self._key,
-                self._device_id,
-            )
-
-    def _get_parameter_name(self) -> str | None:
-        """Get the Controme API parameter name for this entity."""
-        # Map entity keys to Controme API parameter names
-        param_map = {
-            "locked": "locked",
-            "is_main_sensor": "isMainSensor",
-            "temp_mode_temporary": "tempModeTemporary",
-            "battery_saving_mode": "batterySavingMode",
-        }
-        return param_map.get(self._key)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        # Check coordinator availability first
-        if not super().available:
-            return False
-        
-        # During cooldown period (60 seconds after change), entity is not available
-        if self._last_change_time:
-            from datetime import datetime, timedelta
-            elapsed = datetime.now() - self._last_change_time
-            if elapsed < timedelta(seconds=60):
-                return False
-        
-        return True
+        # Show the new value right away; the refresh after the write overwrites it
+        # if the device disagrees
+        thermostat = self.thermostat
+        if thermostat is not None:
+            setattr(thermostat, self._key, value)
+            self.coordinator.async_notify_thermostat_changed(self._device_id)
 
 
 class ContromeLock(ContromeSwitchBase):
@@ -194,6 +165,8 @@ class ContromeLock(ContromeSwitchBase):
     Note: Changes may take up to 60 seconds to appear on the physical device.
     """
 
+    _param_name = "locked"
+
     def __init__(
         self,
         coordinator: ContromeDataUpdateCoordinator,
@@ -209,12 +182,6 @@ class ContromeLock(ContromeSwitchBase):
             "mdi:lock-open",
         )
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        thermostat = self.thermostat
-        return thermostat.locked if thermostat else False
-
 
 class ContromeMainSensor(ContromeSwitchBase):
     """Switch entity for main sensor (determines room target temperature).
@@ -222,6 +189,8 @@ class ContromeMainSensor(ContromeSwitchBase):
     Note: Changes may take up to 60 seconds to appear on the physical device.
     """
 
+    _param_name = "isMainSensor"
+
     def __init__(
         self,
         coordinator: ContromeDataUpdateCoordinator,
@@ -237,16 +206,12 @@ class ContromeMainSensor(ContromeSwitchBase):
             "mdi:thermometer",
         )
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        thermostat = self.thermostat
-        return thermostat.is_main_sensor if thermostat else False
-
 
 class ContromeTempModeTemporary(ContromeSwitchBase):
     """Switch entity for temporary temperature mode."""
 
+    _param_name = "tempModeTemporary"
+
     def __init__(
         self,
         coordinator: ContromeDataUpdateCoordinator,
@@ -262,16 +227,12 @@ class ContromeTempModeTemporary(ContromeSwitchBase):
             "mdi:timer-off",
         )
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        thermostat = self.thermostat
-        return thermostat.temp_mode_temporary if thermostat else False
-
 
 class ContromeBatterySavingMode(ContromeSwitchBase):
     """Switch entity for battery saving mode."""
 
+    _param_name = "batterySavingMode"
+
     def __init__(
         self,
         coordinator: ContromeDataUpdateCoordinator,
@@ -287,8 +248,11 @@ class ContromeBatterySavingMode(ContromeSwitchBase):
             "mdi:battery",
         )
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        thermostat = self.thermostat
-        return thermostat.battery_saving_mode if thermostat else False
+
+# Switch entities created for each thermostat
+_SWITCH_CLASSES: tuple[type[ContromeSwitchBase], ...] = (
+    ContromeLock,
+    ContromeMainSensor,
+    ContromeTempModeTemporary,
+    ContromeBatterySavingMode,
+)